@@ -39,16 +39,17 @@ class PiccoloORMPlugin(SerializationPluginProtocol[Table, BaseModel], OpenAPISch
         """
         parameter_name = kwargs.get("parameter_name")
         if parameter_name == "data":
-            if model_class not in self._data_models_map:
-                self._data_models_map[model_class] = create_pydantic_model(
+            if (data_model := self._data_models_map.get(model_class)) is None:
+                data_model = self._data_models_map[model_class] = create_pydantic_model(
                     table=model_class, model_name=f"{model_class.__name__}RequestBody"
                 )
-            return self._data_models_map[model_class]
-        if model_class not in self._models_map:
-            self._models_map[model_class] = create_pydantic_model(
+            return data_model
+        if (model := self._models_map.get(model_class)) is None:
+            model = create_pydantic_model(
                 table=model_class, model_name=model_class.__name__, nested=True, include_default_columns=True
             )
-        return self._models_map[model_class]
+            self._models_map[model_class] = model
+        return model
 
     @staticmethod
     def is_plugin_supported_type(value: Any) -> "TypeGuard[Table]":
@@ -73,7 +73,7 @@ class TortoiseORMPlugin(SerializationPluginProtocol[Model, BaseModel], OpenAPISc
         """
         parameter_name = kwargs.pop("parameter_name", None)
         if parameter_name == "data":
-            if model_class not in self._data_models_map:
+            if (data_model := self._data_models_map.get(model_class)) is None:
                 fields_to_exclude: List[str] = [
                     field_name
                     for field_name, tortoise_model_field in model_class._meta.fields_map.items()
@@ -82,12 +82,15 @@ class TortoiseORMPlugin(SerializationPluginProtocol[Model, BaseModel], OpenAPISc
                 kwargs.update(
                     exclude=tuple(fields_to_exclude), exclude_readonly=True, name=f"{model_class.__name__}RequestBody"
                 )
-                self._data_models_map[model_class] = self._create_pydantic_model(model_class=model_class, **kwargs)
-            return self._data_models_map[model_class]
-        if model_class not in self._models_map:
+                data_model = self._data_models_map[model_class] = self._create_pydantic_model(
+                    model_class=model_class, **kwargs
+                )
+            return data_model
+        if (model := self._models_map.get(model_class)) is None:
             kwargs.update(name=model_class.__name__)
-            self._models_map[model_class] = self._create_pydantic_model(model_class=model_class, **kwargs)
-        return self._models_map[model_class]
+            model = self._create_pydantic_model(model_class=model_class, **kwargs)
+            self._models_map[model_class] = model
+        return model
 
     @staticmethod
     def is_plugin_supported_type(value: Any) -> "TypeGuard[Model]":
@@ -39,7 +39,16 @@ class CacheObject:
 class RateLimitMiddleware(AbstractMiddleware):
     """Rate-limiting middleware."""
 
-    __slots__ = ("app", "cache", "check_throttle_handler", "max_requests", "unit", "request_quota", "config")
+    __slots__ = (
+        "app",
+        "cache",
+        "check_throttle_handler",
+        "duration",
+        "max_requests",
+        "unit",
+        "request_quota",
+        "config",
+    )
 
     cache: Cache
 
@@ -57,6 +66,7 @@ class RateLimitMiddleware(AbstractMiddleware):
         self.config = config
         self.max_requests: int = config.rate_limit[1]
         self.unit: DurationUnit = config.rate_limit[0]
+        self.duration: int = DURATION_VALUES[self.unit]
 
     async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """ASGI callable.
@@ -146,7 +156,7 @@ class RateLimitMiddleware(AbstractMiddleware):
         Returns:
             An :class:`CacheObject`.
         """
-        duration = DURATION_VALUES[self.unit]
+        duration = self.duration
         now = int(time())
         cached_string = await self.cache.get(key)
         if cached_string:
@@ -171,7 +181,7 @@ class RateLimitMiddleware(AbstractMiddleware):
             None
         """
         cache_object.history = [int(time()), *cache_object.history]
-        await self.cache.set(key, encode_json(cache_object), expiration=DURATION_VALUES[self.unit])
+        await self.cache.set(key, encode_json(cache_object), expiration=self.duration)
 
     async def should_check_request(self, request: "Request[Any, Any, Any]") -> bool:
         """Return a boolean indicating if a request should be checked for rate limiting.
@@ -203,7 +213,7 @@ class RateLimitMiddleware(AbstractMiddleware):
         )
 
         return {
-            self.config.rate_limit_policy_header_key: f"{self.max_requests}; w={DURATION_VALUES[self.unit]}",
+            self.config.rate_limit_policy_header_key: f"{self.max_requests}; w={self.duration}",
             self.config.rate_limit_limit_header_key: str(self.max_requests),
             self.config.rate_limit_remaining_header_key: remaining_requests,
             self.config.rate_limit_reset_header_key: str(int(time()) - cache_object.reset),
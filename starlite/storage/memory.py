@@ -53,22 +53,34 @@ class MemoryStorage(Storage):
             The value associated with ``key`` if it exists and is not expired, else
             ``None``
         """
-        async with self._lock:
-            storage_obj = self._store.get(key)
-
-            if not storage_obj:
-                return None
-
-            if storage_obj.expired:
-                self._store.pop(key)
-                return None
-
-            if renew_for and storage_obj.expires_at:
-                # don't use .set() here, so we can hold onto the lock for the whole operation
-                storage_obj = StorageObject.new(data=storage_obj.data, expires_in=renew_for)
-                self._store[key] = storage_obj
-
-            return storage_obj.data
+        # plain reads don't need the lock; 'dict.get' is atomic, and we only acquire the
+        # lock on the paths that mutate the store
+        storage_obj = self._store.get(key)
+
+        if not storage_obj:
+            return None
+
+        if storage_obj.expired:
+            async with self._lock:
+                # re-check under the lock: another task may have replaced the value in the meantime
+                if self._store.get(key) is storage_obj:
+                    self._store.pop(key)
+            return None
+
+        if renew_for and storage_obj.expires_at:
+            async with self._lock:
+                # re-check under the lock: a concurrent set() or delete() may have won the race,
+                # and renewing the object read before the lock was acquired would clobber it
+                current = self._store.get(key)
+                if current is storage_obj:
+                    storage_obj = StorageObject.new(data=storage_obj.data, expires_in=renew_for)
+                    self._store[key] = storage_obj
+                elif current is None or current.expired:
+                    return None
+                else:
+                    storage_obj = current
+
+        return storage_obj.data
 
     async def delete(self, key: str) -> None:
         """Delete a value.
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal, Mapping, Sequence
+from inspect import signature
+from typing import TYPE_CHECKING, Any, Callable, Literal, Mapping, TypeVar, cast
 
 from starlite.app import DEFAULT_CACHE_CONFIG, Starlite
 from starlite.controller import Controller
 from starlite.events import SimpleEventEmitter
 from starlite.testing.client import AsyncTestClient, TestClient
-from starlite.utils.predicates import is_class_and_subclass
 
 if TYPE_CHECKING:
+    from typing import Sequence
+
     from starlite import Request, WebSocket
     from starlite.cache.config import CacheConfig
     from starlite.config.allowed_hosts import AllowedHostsConfig
@@ -43,6 +45,79 @@ if TYPE_CHECKING:
     )
 
 
+_SyncTestClient = TestClient[Starlite]
+_AsyncTestClient = AsyncTestClient[Starlite]
+
+_STARLITE_INIT_PARAMS = frozenset(signature(Starlite.__init__).parameters) - {"self", "route_handlers"}
+"""Names of the :class:`Starlite <.app.Starlite>` parameters the test client helpers forward, computed from the app
+signature at import time so the helpers can build the app kwargs with a single dict comprehension instead of
+re-binding every keyword at each call, and so the set cannot drift from the app signature.
+"""
+
+_CLIENT_INIT_PARAMS = frozenset(signature(TestClient.__init__).parameters) - {"self", "app"}
+"""Names of the parameters forwarded to the test client classes, computed the same way.
+:class:`AsyncTestClient <.testing.AsyncTestClient>` accepts the identical set.
+"""
+
+_STARLITE_INIT_DEFAULTS = {
+    name: parameter.default
+    for name, parameter in signature(Starlite.__init__).parameters.items()
+    if name in _STARLITE_INIT_PARAMS
+}
+"""Default values of the forwarded :class:`Starlite <.app.Starlite>` parameters. Values identical to these are not
+passed through, so ``Starlite()`` only has to bind the kwargs a caller actually overrode. The helpers intentionally
+diverge from some app defaults (e.g. ``openapi_config`` and ``logging_config``), and those values fail the identity
+check and are still passed explicitly.
+"""
+
+_TClient = TypeVar("_TClient", bound="TestClient | AsyncTestClient")
+
+
+def _prepare_route_handlers(
+    route_handlers: ControllerRouterHandler | Sequence[ControllerRouterHandler] | None,
+) -> Sequence[ControllerRouterHandler]:
+    """Normalize the ``route_handlers`` argument of the test client helpers into a sequence.
+
+    The branches are ordered cheapest and most common first: virtually every caller passes ``None``, a ``list`` or a
+    ``tuple``, all of which are settled before any subclass or attribute probing runs.
+    """
+    if route_handlers is None:
+        return ()
+    if isinstance(route_handlers, (list, tuple)):
+        return route_handlers
+    if (isinstance(route_handlers, type) and issubclass(route_handlers, Controller)) or not hasattr(
+        route_handlers, "__iter__"
+    ):
+        return (route_handlers,)
+    # anything iterable that isn't a Controller subclass or a single handler; the __iter__
+    # probe isn't a narrowing mypy can follow, so cast
+    return cast("Sequence[ControllerRouterHandler]", route_handlers)
+
+
+def _create_test_client(client_cls: Callable[..., _TClient], params: dict[str, Any]) -> _TClient:
+    """Shared core of :func:`create_test_client` and :func:`create_async_test_client`.
+
+    Args:
+        client_cls: The test client class to instantiate.
+        params: The mapping of local names to values captured in the calling helper.
+
+    Returns:
+        An instance of ``client_cls`` wrapping a created app instance.
+    """
+    app_kwargs = {
+        key: value
+        for key, value in params.items()
+        if key in _STARLITE_INIT_PARAMS and value is not _STARLITE_INIT_DEFAULTS[key]
+    }
+
+    client_kwargs = {key: value for key, value in params.items() if key in _CLIENT_INIT_PARAMS}
+
+    return client_cls(
+        app=Starlite(route_handlers=_prepare_route_handlers(params["route_handlers"]), **app_kwargs),
+        **client_kwargs,
+    )
+
+
 def create_test_client(
     route_handlers: ControllerRouterHandler | Sequence[ControllerRouterHandler] | None = None,
     after_exception: OptionalSequence[AfterExceptionHookHandler] = None,
@@ -181,55 +256,7 @@ def create_test_client(
     Returns:
         An instance of :class:`TestClient <.testing.TestClient>` with a created app instance.
     """
-    route_handlers = () if route_handlers is None else route_handlers
-    if is_class_and_subclass(route_handlers, Controller) or not isinstance(route_handlers, Sequence):
-        route_handlers = (route_handlers,)
-
-    return TestClient[Starlite](
-        app=Starlite(
-            after_exception=after_exception,
-            after_request=after_request,
-            after_response=after_response,
-            after_shutdown=after_shutdown,
-            after_startup=after_startup,
-            allowed_hosts=allowed_hosts,
-            before_request=before_request,
-            before_send=before_send,
-            before_shutdown=before_shutdown,
-            before_startup=before_startup,
-            cache_config=cache_config,
-            compression_config=compression_config,
-            cors_config=cors_config,
-            csrf_config=csrf_config,
-            dependencies=dependencies,
-            event_emitter_backend=event_emitter_backend,
-            exception_handlers=exception_handlers,
-            guards=guards,
-            initial_state=initial_state,
-            listeners=listeners,
-            logging_config=logging_config,
-            middleware=middleware,
-            multipart_form_part_limit=multipart_form_part_limit,
-            on_app_init=on_app_init,
-            on_shutdown=on_shutdown,
-            on_startup=on_startup,
-            openapi_config=openapi_config,
-            parameters=parameters,
-            plugins=plugins,
-            request_class=request_class,
-            response_class=response_class,
-            route_handlers=route_handlers,
-            static_files_config=static_files_config,
-            template_config=template_config,
-            websocket_class=websocket_class,
-        ),
-        backend=backend,
-        backend_options=backend_options,
-        base_url=base_url,
-        raise_server_exceptions=raise_server_exceptions,
-        root_path=root_path,
-        session_config=session_config,
-    )
+    return _create_test_client(_SyncTestClient, locals())
 
 
 def create_async_test_client(
@@ -370,52 +397,4 @@ def create_async_test_client(
     Returns:
         An instance of :class:`AsyncTestClient <starlite.testing.AsyncTestClient>` with a created app instance.
     """
-    route_handlers = () if route_handlers is None else route_handlers
-    if is_class_and_subclass(route_handlers, Controller) or not isinstance(route_handlers, Sequence):
-        route_handlers = (route_handlers,)
-
-    return AsyncTestClient[Starlite](
-        app=Starlite(
-            after_exception=after_exception,
-            after_request=after_request,
-            after_response=after_response,
-            after_shutdown=after_shutdown,
-            after_startup=after_startup,
-            allowed_hosts=allowed_hosts,
-            before_request=before_request,
-            before_send=before_send,
-            before_shutdown=before_shutdown,
-            before_startup=before_startup,
-            cache_config=cache_config,
-            compression_config=compression_config,
-            cors_config=cors_config,
-            csrf_config=csrf_config,
-            dependencies=dependencies,
-            event_emitter_backend=event_emitter_backend,
-            exception_handlers=exception_handlers,
-            guards=guards,
-            initial_state=initial_state,
-            listeners=listeners,
-            logging_config=logging_config,
-            middleware=middleware,
-            multipart_form_part_limit=multipart_form_part_limit,
-            on_app_init=on_app_init,
-            on_shutdown=on_shutdown,
-            on_startup=on_startup,
-            openapi_config=openapi_config,
-            parameters=parameters,
-            plugins=plugins,
-            request_class=request_class,
-            response_class=response_class,
-            route_handlers=route_handlers,
-            static_files_config=static_files_config,
-            template_config=template_config,
-            websocket_class=websocket_class,
-        ),
-        backend=backend,
-        backend_options=backend_options,
-        base_url=base_url,
-        raise_server_exceptions=raise_server_exceptions,
-        root_path=root_path,
-        session_config=session_config,
-    )
+    return _create_test_client(_AsyncTestClient, locals())
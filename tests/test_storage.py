@@ -18,6 +18,7 @@ if TYPE_CHECKING:
 
     from starlite.storage.base import Storage
     from starlite.storage.file import FileStorage
+    from starlite.storage.memory import MemoryStorage
 
 
 @pytest.fixture()
@@ -248,3 +249,21 @@ async def test_memory_delete_expired(storage_backend_fixture: str, request: Fixt
 
     assert not any([await storage_backend.exists(key) for key in expect_expired])
     assert all([await storage_backend.exists(key) for key in expect_not_expired])
+
+
+async def test_memory_get_renew_does_not_clobber_concurrent_set(memory_storage_backend: MemoryStorage) -> None:
+    await memory_storage_backend.set("foo", b"old", expires_in=10)
+
+    async with anyio.create_task_group() as task_group:
+        # hold the lock so both tasks queue on it: the set first, then the renewing get,
+        # which performs its lock-free read of the old value before blocking. the set then
+        # completes before the renewer acquires the lock, and the renew must not write the
+        # stale object back
+        await memory_storage_backend._lock.acquire()
+        task_group.start_soon(memory_storage_backend.set, "foo", b"new", 10)
+        await anyio.sleep(0.01)
+        task_group.start_soon(memory_storage_backend.get, "foo", 100)
+        await anyio.sleep(0.01)
+        memory_storage_backend._lock.release()
+
+    assert await memory_storage_backend.get("foo") == b"new"